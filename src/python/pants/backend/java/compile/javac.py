@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+import heapq
 import itertools
 import logging
-from itertools import chain
+import shlex
 
 from pants.backend.java.dependency_inference.rules import (
     JavaInferredDependencies,
@@ -16,7 +18,14 @@ from pants.backend.java.subsystems.javac import JavacSubsystem
 from pants.backend.java.target_types import JavaFieldSet, JavaGeneratorFieldSet, JavaSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.core.util_rules.system_binaries import BashBinary, ZipBinary
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, MergeDigests, Snapshot
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    CreateDigest,
+    Digest,
+    Directory,
+    FileContent,
+    MergeDigests,
+)
 from pants.engine.process import FallibleProcessResult, Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
@@ -35,6 +44,7 @@ from pants.jvm.compile import rules as jvm_compile_rules
 from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
 from pants.jvm.strip_jar.strip_jar import StripJarRequest
 from pants.jvm.subsystems import JvmSubsystem
+from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -42,6 +52,8 @@ logger = logging.getLogger(__name__)
 
 class CompileJavaSourceRequest(ClasspathEntryRequest):
     field_sets = (JavaFieldSet, JavaGeneratorFieldSet)
+    requests_prerequisite = True
+    requests_dependencies = True
 
 
 # TODO: This code is duplicated in the javac and BSP rules.
@@ -49,12 +61,19 @@ def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
     return f"{ctgt.representative.address.path_safe_spec}.javac.jar"
 
 
+def _quote_argfile_arg(arg: str) -> str:
+    """Quote an argument for use in a javac `@argfile`, where backslashes are escape characters."""
+    escaped = arg.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 @rule(desc="Compile with javac")
 async def compile_java_source(
     bash: BashBinary,
     javac: JavacSubsystem,
     zip_binary: ZipBinary,
     jvm: JvmSubsystem,
+    global_options: GlobalOptions,
     request: CompileJavaSourceRequest,
 ) -> FallibleClasspathEntry:
     # Request the component's direct dependency classpath, and additionally any prerequisite.
@@ -122,10 +141,18 @@ async def compile_java_source(
     ]
     if not component_members_and_java_source_files:
         # Is a generator, and so exports all of its direct deps.
-        exported_digest = await Get(
-            Digest, MergeDigests(cpe.digest for cpe in direct_dependency_classpath_entries)
-        )
-        classpath_entry = ClasspathEntry.merge(exported_digest, direct_dependency_classpath_entries)
+        if len(direct_dependency_classpath_entries) == 1:
+            # NB: Merging a single entry would produce an identical entry, so we export it as-is
+            # rather than requesting an identical merged digest. This is the common case of a
+            # generator which owns a single file.
+            classpath_entry = direct_dependency_classpath_entries[0]
+        else:
+            exported_digest = await Get(
+                Digest, MergeDigests(cpe.digest for cpe in direct_dependency_classpath_entries)
+            )
+            classpath_entry = ClasspathEntry.merge(
+                exported_digest, direct_dependency_classpath_entries
+            )
         return FallibleClasspathEntry(
             description=str(request.component),
             result=CompileResult.SUCCEEDED,
@@ -133,12 +160,34 @@ async def compile_java_source(
             exit_code=0,
         )
 
+    # NB: The engine orders `Snapshot.files` by path component (so `a/x.java` precedes `a-b.java`),
+    # which usually, but not always, matches Python string order. Merge the per-snapshot lists, and
+    # only fall back to a full sort if the result turns out not to be sorted.
+    sorted_source_files = list(
+        heapq.merge(
+            *(sources.snapshot.files for _, sources in component_members_and_java_source_files)
+        )
+    )
+    if any(
+        a > b for a, b in zip(sorted_source_files, itertools.islice(sorted_source_files, 1, None))
+    ):
+        sorted_source_files.sort()
+    # NB: Sources are passed to javac via an argument file, which keeps the argv small and
+    # bounded for components with very many sources. Each path is quoted, so that whitespace in
+    # filenames is preserved.
+    sources_argfile = "__sources.txt"
+    sources_argfile_content = "\n".join(_quote_argfile_arg(f) for f in sorted_source_files)
+
     dest_dir = "classfiles"
-    dest_dir_digest, jdk = await MultiGet(
+    dest_dir_digest, sources_argfile_digest, jdk = await MultiGet(
         Get(
             Digest,
             CreateDigest([Directory(dest_dir)]),
         ),
+        Get(
+            Digest,
+            CreateDigest([FileContent(sources_argfile, sources_argfile_content.encode())]),
+        ),
         Get(JdkEnvironment, JdkRequest, JdkRequest.from_target(request.component)),
     )
     merged_digest = await Get(
@@ -146,6 +195,7 @@ async def compile_java_source(
         MergeDigests(
             (
                 dest_dir_digest,
+                sources_argfile_digest,
                 *(
                     sources.snapshot.digest
                     for _, sources in component_members_and_java_source_files
@@ -160,31 +210,68 @@ async def compile_java_source(
     immutable_input_digests = dict(user_classpath.root_immutable_inputs(prefix=usercp))
 
     # Compile.
-    compile_result = await Get(
-        FallibleProcessResult,
-        JvmProcess(
-            jdk=jdk,
-            classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
-            argv=[
-                "com.sun.tools.javac.Main",
-                *(("-cp", classpath_arg) if classpath_arg else ()),
-                *javac.args,
-                "-d",
-                dest_dir,
-                *sorted(
-                    chain.from_iterable(
-                        sources.snapshot.files
-                        for _, sources in component_members_and_java_source_files
-                    )
-                ),
-            ],
-            input_digest=merged_digest,
-            extra_immutable_input_digests=immutable_input_digests,
-            output_directories=(dest_dir,),
-            description=f"Compile {request.component} with javac",
-            level=LogLevel.DEBUG,
-        ),
+    output_file = compute_output_jar_filename(request.component)
+    javac_process = JvmProcess(
+        jdk=jdk,
+        classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
+        argv=[
+            "com.sun.tools.javac.Main",
+            *(("-cp", classpath_arg) if classpath_arg else ()),
+            *javac.args,
+            "-d",
+            dest_dir,
+            f"@{sources_argfile}",
+        ],
+        input_digest=merged_digest,
+        extra_immutable_input_digests=immutable_input_digests,
+        output_directories=(dest_dir,),
+        description=f"Compile {request.component} with javac",
+        level=LogLevel.DEBUG,
     )
+
+    # Without nailgun, javac can be invoked via a `bash` wrapper, and so we jar up the outputs in
+    # the same process, which avoids a second process and a round-trip of the outputs.
+    jar_in_compile_process = not global_options.process_execution_local_enable_nailgun
+    if jar_in_compile_process:
+        # NB: The process is constructed without nailgun so that it does not inherit nailgun's
+        # remote cache speculation delay.
+        process = await Get(
+            Process, JvmProcess, dataclasses.replace(javac_process, use_nailgun=False)
+        )
+        jar_command = " ".join(
+            [
+                "cd",
+                dest_dir,
+                "&&",
+                # If there was no output, then do not create a jar file. This may occur, for
+                # example, when compiling a `package-info.java` in a single partition.
+                "if compgen -G '*' > /dev/null; then",
+                shlex.quote(zip_binary.path),
+                # NB: `-q`, since stdout is rendered as the output of the compile.
+                "-q",
+                # NB: Store only: compressing many small classfiles costs more than it saves.
+                "-0",
+                # NB: Omit extra file attributes (uid/gid, extended timestamps) from each entry.
+                "-X",
+                "-r",
+                shlex.quote(f"../{output_file}"),
+                ".;",
+                "fi",
+            ]
+        )
+        compile_result = await Get(
+            FallibleProcessResult,
+            Process,
+            dataclasses.replace(
+                process,
+                argv=(bash.path, "-c", f"{shlex.join(process.argv)} && {jar_command}"),
+                output_files=(output_file,),
+                output_directories=(),
+            ),
+        )
+    else:
+        compile_result = await Get(FallibleProcessResult, JvmProcess, javac_process)
+
     if compile_result.exit_code != 0:
         return FallibleClasspathEntry.from_fallible_process_result(
             str(request.component),
@@ -192,25 +279,28 @@ async def compile_java_source(
             None,
         )
 
-    # Jar.
-    # NB: We jar up the outputs in a separate process because the nailgun runner cannot support
-    # invoking via a `bash` wrapper (since the trailing portion of the command is executed by
-    # the nailgun server). We might be able to resolve this in the future via a Javac wrapper shim.
-    output_snapshot = await Get(Snapshot, Digest, compile_result.output_digest)
-    output_file = compute_output_jar_filename(request.component)
-    output_files: tuple[str, ...] = (output_file,)
-    if output_snapshot.files:
+    output_files: tuple[str, ...]
+    if jar_in_compile_process:
+        jar_output_digest = compile_result.output_digest
+        output_files = (output_file,) if jar_output_digest != EMPTY_DIGEST else ()
+    elif compile_result.output_digest != dest_dir_digest:
+        # NB: When javac produces no classfiles, its output is exactly the (empty) destination
+        # directory that it was given, so there is no need to snapshot the output to detect that.
+
+        # Jar.
+        # NB: We jar up the outputs in a separate process because the nailgun runner cannot support
+        # invoking via a `bash` wrapper (since the trailing portion of the command is executed by
+        # the nailgun server). We might be able to resolve this in the future via a Javac wrapper
+        # shim. `zip` is invoked directly from within the destination directory: outputs are
+        # captured relative to the `working_directory`, so the jar lands at the root of the digest.
+        # As in the non-nailgun case, entries are stored (`-0`) without extra attributes (`-X`).
+        output_files = (output_file,)
         jar_result = await Get(
             ProcessResult,
             Process(
-                argv=[
-                    bash.path,
-                    "-c",
-                    " ".join(
-                        ["cd", dest_dir, ";", zip_binary.path, "-r", f"../{output_file}", "."]
-                    ),
-                ],
+                argv=[zip_binary.path, "-0", "-X", "-r", output_file, "."],
                 input_digest=compile_result.output_digest,
+                working_directory=dest_dir,
                 output_files=output_files,
                 description=f"Capture outputs of {request.component} for javac",
                 level=LogLevel.TRACE,
@@ -218,8 +308,8 @@ async def compile_java_source(
         )
         jar_output_digest = jar_result.output_digest
     else:
-        # If there was no output, then do not create a jar file. This may occur, for example, when compiling
-        # a `package-info.java` in a single partition.
+        # If there was no output, then do not create a jar file. This may occur, for example,
+        # when compiling a `package-info.java` in a single partition.
         output_files = ()
         jar_output_digest = EMPTY_DIGEST
 
@@ -11,7 +11,7 @@ from internal_plugins.test_lockfile_fixtures.lockfile_fixture import (
     JVMLockfileFixture,
     JVMLockfileFixtureDefinition,
 )
-from pants.backend.java.compile.javac import CompileJavaSourceRequest
+from pants.backend.java.compile.javac import CompileJavaSourceRequest, _quote_argfile_arg
 from pants.backend.java.compile.javac import rules as javac_rules
 from pants.backend.java.dependency_inference.rules import rules as java_dep_inf_rules
 from pants.backend.java.goals.check import JavacCheckRequest
@@ -145,6 +145,59 @@ def test_compile_no_deps(rule_runner: RuleRunner) -> None:
     assert set(check_results) == {CheckResult(0, "", "")}
 
 
+@maybe_skip_jdk_test
+def test_compile_without_nailgun(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--no-process-execution-local-enable-nailgun"], env_inherit=PYTHON_BOOTSTRAP_ENV
+    )
+    rule_runner.write_files(
+        {
+            "BUILD": "java_sources(name='lib')",
+            "3rdparty/jvm/default.lock": EMPTY_JVM_LOCKFILE,
+            "ExampleLib.java": JAVA_LIB_SOURCE,
+        }
+    )
+    coarsened_target = expect_single_expanded_coarsened_target(
+        rule_runner, Address(spec_path="", target_name="lib")
+    )
+
+    classpath = rule_runner.request(
+        RenderedClasspath,
+        [CompileJavaSourceRequest(component=coarsened_target, resolve=make_resolve(rule_runner))],
+    )
+    assert classpath.content == {
+        ".ExampleLib.java.lib.javac.jar": {"org/pantsbuild/example/lib/ExampleLib.class"}
+    }
+
+
+@maybe_skip_jdk_test
+def test_compile_source_with_space_in_path(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "java_sources(name='lib')",
+            "3rdparty/jvm/default.lock": EMPTY_JVM_LOCKFILE,
+            # NB: A non-public class may be declared in a file with an arbitrary name.
+            "Example Lib.java": JAVA_LIB_SOURCE.replace("public class", "class"),
+        }
+    )
+    coarsened_target = expect_single_expanded_coarsened_target(
+        rule_runner, Address(spec_path="", target_name="lib")
+    )
+
+    classpath = rule_runner.request(
+        RenderedClasspath,
+        [CompileJavaSourceRequest(component=coarsened_target, resolve=make_resolve(rule_runner))],
+    )
+    assert list(classpath.content.values()) == [{"org/pantsbuild/example/lib/ExampleLib.class"}]
+
+
+def test_quote_argfile_arg() -> None:
+    assert _quote_argfile_arg("A.java") == '"A.java"'
+    assert _quote_argfile_arg("dir with space/A.java") == '"dir with space/A.java"'
+    assert _quote_argfile_arg('a"b.java') == '"a\\"b.java"'
+    assert _quote_argfile_arg("a\\b.java") == '"a\\\\b.java"'
+
+
 @maybe_skip_jdk_test
 def test_compile_jdk_versions(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
@@ -585,7 +638,12 @@ def test_compile_with_deps(rule_runner: RuleRunner) -> None:
 
 
 @maybe_skip_jdk_test
-def test_compile_of_package_info(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("enable_nailgun", [True, False])
+def test_compile_of_package_info(rule_runner: RuleRunner, enable_nailgun: bool) -> None:
+    if not enable_nailgun:
+        rule_runner.set_options(
+            ["--no-process-execution-local-enable-nailgun"], env_inherit=PYTHON_BOOTSTRAP_ENV
+        )
     rule_runner.write_files(
         {
             "BUILD": dedent(
@@ -608,18 +666,16 @@ def test_compile_of_package_info(rule_runner: RuleRunner) -> None:
             ),
         }
     )
-    classpath = rule_runner.request(
-        RenderedClasspath,
-        [
-            CompileJavaSourceRequest(
-                component=expect_single_expanded_coarsened_target(
-                    rule_runner, Address(spec_path="", target_name="main")
-                ),
-                resolve=make_resolve(rule_runner),
-            )
-        ],
+    request = CompileJavaSourceRequest(
+        component=expect_single_expanded_coarsened_target(
+            rule_runner, Address(spec_path="", target_name="main")
+        ),
+        resolve=make_resolve(rule_runner),
     )
+    classpath = rule_runner.request(RenderedClasspath, [request])
     assert classpath.content == {}
+    classpath_entry = rule_runner.request(ClasspathEntry, [request])
+    assert classpath_entry.filenames == ()
 
 
 @maybe_skip_jdk_test
@@ -13,9 +13,9 @@ from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTargets
 from pants.engine.unions import UnionRule
 from pants.jvm.compile import (
-    ClasspathEntryRequest,
+    ClasspathEntryClosureRequest,
     ClasspathEntryRequestFactory,
-    FallibleClasspathEntry,
+    FallibleClasspathEntries,
 )
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.util.logging import LogLevel
@@ -43,13 +43,12 @@ async def javac_check(
         Get(CoursierResolveKey, CoarsenedTargets([t])) for t in coarsened_targets
     )
 
-    results = await MultiGet(
-        Get(
-            FallibleClasspathEntry,
-            ClasspathEntryRequest,
-            classpath_entry_request.for_targets(component=target, resolve=resolve),
-        )
-        for target, resolve in zip(coarsened_targets, resolves)
+    results = await Get(
+        FallibleClasspathEntries,
+        ClasspathEntryClosureRequest(
+            classpath_entry_request.for_targets(component=target, resolve=resolve)
+            for target, resolve in zip(coarsened_targets, resolves)
+        ),
     )
 
     # NB: We don't pass stdout/stderr as it will have already been rendered as streaming.
@@ -47,6 +47,7 @@ logger = logging.getLogger(__name__)
 class CompileKotlinSourceRequest(ClasspathEntryRequest):
     field_sets = (KotlinFieldSet, KotlinGeneratorFieldSet)
     field_sets_consume_only = (JavaFieldSet, JavaGeneratorFieldSet)
+    requests_dependencies = True
 
 
 def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
@@ -12,6 +12,7 @@ from pants.backend.rust.target_types import RustPackageSourcesField
 from pants.backend.rust.util_rules.toolchains import RustToolchainProcess
 from pants.core.goals.fmt import FmtResult, FmtTargetsRequest
 from pants.core.util_rules.partitions import PartitionerType
+from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, Snapshot
 from pants.engine.internals.selectors import Get
 from pants.engine.process import ProcessResult
 from pants.engine.rules import collect_rules, rule
@@ -39,18 +40,44 @@ class RustfmtRequest(FmtTargetsRequest):
 
 @rule(desc="Format with rustfmt")
 async def rustfmt_fmt(request: RustfmtRequest.Batch) -> FmtResult:
+    # NB: `sources` may match non-Rust files, which `rustfmt` must not be invoked on.
+    rust_files = tuple(f for f in request.snapshot.files if f.endswith(".rs"))
+    if not rust_files:
+        return FmtResult(
+            input=request.snapshot,
+            output=request.snapshot,
+            stdout="",
+            stderr="",
+            tool_name=request.tool_name,
+        )
+
     result = await Get(
         ProcessResult,
         RustToolchainProcess(
             binary="rustfmt",
-            args=request.snapshot.files,
+            args=rust_files,
             input_digest=request.snapshot.digest,
-            output_files=request.snapshot.files,
-            description=f"Run rustfmt on {pluralize(len(request.files), 'file')}.",
+            output_files=rust_files,
+            description=f"Run rustfmt on {pluralize(len(rust_files), 'file')}.",
             level=LogLevel.DEBUG,
         ),
     )
-    return await FmtResult.create(request, result)
+    if len(rust_files) == len(request.snapshot.files):
+        return await FmtResult.create(request, result)
+
+    # Only the Rust files are captured as outputs, so restore the rest of the batch unchanged.
+    non_rust_files = tuple(f for f in request.snapshot.files if not f.endswith(".rs"))
+    non_rust_digest = await Get(
+        Digest, DigestSubset(request.snapshot.digest, PathGlobs(non_rust_files))
+    )
+    output = await Get(Snapshot, MergeDigests((result.output_digest, non_rust_digest)))
+    return FmtResult(
+        input=request.snapshot,
+        output=output,
+        stdout=result.stdout.decode(),
+        stderr=result.stderr.decode(),
+        tool_name=request.tool_name,
+    )
 
 
 def rules():
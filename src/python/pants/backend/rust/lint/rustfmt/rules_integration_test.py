@@ -113,6 +113,32 @@ def test_failing(rule_runner: RuleRunner) -> None:
     assert fmt_result.did_change is True
 
 
+def test_non_rust_sources(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/lib.rs": BAD_FILE,
+            "Cargo.toml": "",
+            "BUILD": "rust_package(name='package', sources=['src/*.rs', 'Cargo.toml'])",
+        }
+    )
+    tgt = rule_runner.get_target(Address("", target_name="package"))
+    fmt_result = run_rustfmt(rule_runner, [tgt])
+    assert fmt_result.output == rule_runner.make_snapshot(
+        {"src/lib.rs": FIXED_BAD_FILE, "Cargo.toml": ""}
+    )
+    assert fmt_result.did_change is True
+
+
+def test_no_rust_sources(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {"Cargo.toml": "", "BUILD": "rust_package(name='package', sources=['Cargo.toml'])"}
+    )
+    tgt = rule_runner.get_target(Address("", target_name="package"))
+    fmt_result = run_rustfmt(rule_runner, [tgt])
+    assert fmt_result.output == rule_runner.make_snapshot({"Cargo.toml": ""})
+    assert fmt_result.did_change is False
+
+
 def test_mixed_sources(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
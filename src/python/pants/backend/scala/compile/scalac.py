@@ -54,6 +54,7 @@ logger = logging.getLogger(__name__)
 class CompileScalaSourceRequest(ClasspathEntryRequest):
     field_sets = (ScalaFieldSet, ScalaGeneratorFieldSet)
     field_sets_consume_only = (JavaFieldSet, JavaGeneratorFieldSet)
+    requests_dependencies = True
 
 
 @dataclass(frozen=True)
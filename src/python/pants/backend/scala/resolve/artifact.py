@@ -19,6 +19,7 @@ from pants.jvm.compile import (
 
 class ScalaArtifactClasspathEntryRequest(ClasspathEntryRequest):
     field_sets = (ScalaArtifactFieldSet,)
+    requests_dependencies = True
 
 
 @rule
@@ -89,6 +89,15 @@ class ClasspathEntryRequest(metaclass=ABCMeta):
     # True if this request type is only valid at the root of a compile graph.
     root_only: ClassVar[bool] = False
 
+    # Whether the provider of the ClasspathEntry requests its `prerequisite` (if any), and how it
+    # requests its dependencies via a `ClasspathDependenciesRequest`. These are used to compute the
+    # compile graph ahead of time (see `ClasspathEntryClosureRequest`). They default to `False`,
+    # since a provider which does not opt in is only scheduled less eagerly, whereas a provider
+    # which opts in without making those requests would cause unrequested work.
+    requests_prerequisite: ClassVar[bool] = False
+    requests_dependencies: ClassVar[bool] = False
+    ignore_generated_dependencies: ClassVar[bool] = False
+
 
 @dataclass(frozen=True)
 class ClasspathEntryRequestFactory:
@@ -409,17 +418,19 @@ def required_classfiles(fallible_result: FallibleClasspathEntry) -> ClasspathEnt
     )
 
 
-@rule
-def classpath_dependency_requests(
-    classpath_entry_request: ClasspathEntryRequestFactory, request: ClasspathDependenciesRequest
-) -> ClasspathEntryRequests:
+def _classpath_dependency_requests(
+    classpath_entry_request: ClasspathEntryRequestFactory,
+    request: ClasspathEntryRequest,
+    *,
+    ignore_generated: bool,
+) -> Iterator[ClasspathEntryRequest]:
     def ignore_because_generated(coarsened_dep: CoarsenedTarget) -> bool:
-        if not request.ignore_generated:
+        if not ignore_generated:
             return False
         if len(coarsened_dep.members) != 1:
             # Do not ignore a dependency which is involved in a cycle.
             return False
-        us = request.request.component.representative.address
+        us = request.component.representative.address
         them = coarsened_dep.representative.address
         return us.spec_path == them.spec_path and us.target_name == them.target_name
 
@@ -432,12 +443,21 @@ def classpath_dependency_requests(
             or t.has_field(RelocatedFilesOriginalTargetsField)
         ) == len(coarsened_dep.members)
 
+    return (
+        classpath_entry_request.for_targets(component=coarsened_dep, resolve=request.resolve)
+        for coarsened_dep in request.component.dependencies
+        if not ignore_because_generated(coarsened_dep) and not ignore_because_file(coarsened_dep)
+    )
+
+
+@rule
+def classpath_dependency_requests(
+    classpath_entry_request: ClasspathEntryRequestFactory, request: ClasspathDependenciesRequest
+) -> ClasspathEntryRequests:
     return ClasspathEntryRequests(
-        classpath_entry_request.for_targets(
-            component=coarsened_dep, resolve=request.request.resolve
+        _classpath_dependency_requests(
+            classpath_entry_request, request.request, ignore_generated=request.ignore_generated
         )
-        for coarsened_dep in request.request.component.dependencies
-        if not ignore_because_generated(coarsened_dep) and not ignore_because_file(coarsened_dep)
     )
 
 
@@ -450,5 +470,57 @@ async def compile_classpath_entries(requests: ClasspathEntryRequests) -> Fallibl
     )
 
 
+@dataclass(frozen=True)
+class ClasspathEntryClosureRequest:
+    """Request FallibleClasspathEntries for the given roots, after requesting their entire
+    transitive compile graph at once.
+
+    Each provider of a ClasspathEntry requests only its direct dependencies, and so when the roots
+    are requested directly, the compile graph is discovered one level at a time. Computing the
+    closure up front allows the engine to schedule all of it in a single wave.
+    """
+
+    roots: tuple[ClasspathEntryRequest, ...]
+
+    def __init__(self, roots: Iterable[ClasspathEntryRequest]) -> None:
+        object.__setattr__(self, "roots", tuple(roots))
+
+
+def _classpath_entry_closure(
+    classpath_entry_request: ClasspathEntryRequestFactory, roots: Iterable[ClasspathEntryRequest]
+) -> Iterator[ClasspathEntryRequest]:
+    """All ClasspathEntryRequests which the providers for the given roots will transitively make."""
+
+    def dependency_requests(cer: ClasspathEntryRequest) -> Iterator[ClasspathEntryRequest]:
+        if cer.prerequisite and cer.requests_prerequisite:
+            yield cer.prerequisite
+        if cer.requests_dependencies:
+            yield from _classpath_dependency_requests(
+                classpath_entry_request, cer, ignore_generated=cer.ignore_generated_dependencies
+            )
+
+    visited = set()
+    queue = deque(roots)
+    while queue:
+        cer = queue.popleft()
+        if cer in visited:
+            continue
+        visited.add(cer)
+        yield cer
+        queue.extend(dependency_requests(cer))
+
+
+@rule
+async def compile_classpath_entry_closure(
+    classpath_entry_request: ClasspathEntryRequestFactory, request: ClasspathEntryClosureRequest
+) -> FallibleClasspathEntries:
+    closure = tuple(_classpath_entry_closure(classpath_entry_request, request.roots))
+    fallible_entries = await MultiGet(
+        Get(FallibleClasspathEntry, ClasspathEntryRequest, cer) for cer in closure
+    )
+    fallible_entries_by_request = dict(zip(closure, fallible_entries))
+    return FallibleClasspathEntries(fallible_entries_by_request[cer] for cer in request.roots)
+
+
 def rules():
     return collect_rules()
@@ -44,13 +44,14 @@ from pants.backend.scala.dependency_inference.rules import rules as scala_dep_in
 from pants.backend.scala.target_types import ScalaSourcesGeneratorTarget
 from pants.backend.scala.target_types import rules as scala_target_types_rules
 from pants.build_graph.address import Address
-from pants.core.target_types import FilesGeneratorTarget, RelocatedFiles
+from pants.core.target_types import FilesGeneratorTarget, RelocatedFiles, ResourcesGeneratorTarget
 from pants.core.util_rules import config_files, source_files, stripped_source_files
 from pants.core.util_rules.external_tool import rules as external_tool_rules
 from pants.engine.addresses import Addresses
 from pants.engine.fs import EMPTY_DIGEST
 from pants.engine.target import (
     CoarsenedTarget,
+    CoarsenedTargets,
     GeneratedSources,
     HydratedSources,
     HydrateSourcesRequest,
@@ -61,21 +62,29 @@ from pants.engine.target import (
 from pants.jvm import classpath, jdk_rules, testutil
 from pants.jvm.classpath import Classpath
 from pants.jvm.compile import (
+    ClasspathEntry,
+    ClasspathEntryClosureRequest,
     ClasspathEntryRequest,
     ClasspathEntryRequestFactory,
     ClasspathSourceAmbiguity,
     ClasspathSourceMissing,
+    CompileResult,
+    FallibleClasspathEntries,
+    _classpath_entry_closure,
 )
 from pants.jvm.goals import lockfile
+from pants.jvm.non_jvm_dependencies import NoopClasspathEntryRequest
 from pants.jvm.resolve.coursier_fetch import CoursierFetchRequest
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.coursier_setup import rules as coursier_setup_rules
 from pants.jvm.resolve.key import CoursierResolveKey
+from pants.jvm.resources import JvmResourcesRequest
 from pants.jvm.strip_jar import strip_jar
 from pants.jvm.target_types import JvmArtifactTarget
 from pants.jvm.testutil import (
     RenderedClasspath,
     expect_single_expanded_coarsened_target,
+    make_resolve,
     maybe_skip_jdk_test,
 )
 from pants.jvm.util_rules import rules as util_rules
@@ -123,6 +132,9 @@ def rule_runner() -> RuleRunner:
             *stripped_source_files.rules(),
             *protobuf_target_types_rules(),
             QueryRule(Classpath, (Addresses,)),
+            QueryRule(CoarsenedTargets, (Addresses,)),
+            QueryRule(ClasspathEntry, (CompileScalaSourceRequest,)),
+            QueryRule(FallibleClasspathEntries, (ClasspathEntryClosureRequest,)),
             QueryRule(RenderedClasspath, (Addresses,)),
             QueryRule(UnexpandedTargets, (Addresses,)),
             QueryRule(HydratedSources, [HydrateSourcesRequest]),
@@ -136,6 +148,7 @@ def rule_runner() -> RuleRunner:
             ScalaSourcesGeneratorTarget,
             FilesGeneratorTarget,
             RelocatedFiles,
+            ResourcesGeneratorTarget,
         ],
     )
     rule_runner.set_options(
@@ -324,6 +337,101 @@ def test_compile_mixed(
     assert len(rendered_classpath.content.keys()) == 3
 
 
+@maybe_skip_jdk_test
+def test_compile_closure(
+    rule_runner: RuleRunner, scala_stdlib_jvm_lockfile: JVMLockfileFixture
+) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "scala_sources(name='main')",
+            "3rdparty/jvm/BUILD": scala_stdlib_jvm_lockfile.requirements_as_jvm_artifact_targets(),
+            "3rdparty/jvm/default.lock": scala_stdlib_jvm_lockfile.serialized_lockfile,
+            "Example.scala": scala_main_source(),
+            "lib/BUILD": "java_sources()",
+            "lib/C.java": java_lib_source(),
+        }
+    )
+    coarsened_target = expect_single_expanded_coarsened_target(
+        rule_runner, Address(spec_path="", target_name="main")
+    )
+    request = CompileScalaSourceRequest(
+        component=coarsened_target, resolve=make_resolve(rule_runner)
+    )
+
+    fallible_entries = rule_runner.request(
+        FallibleClasspathEntries, [ClasspathEntryClosureRequest([request])]
+    )
+    assert len(fallible_entries) == 1
+    assert fallible_entries[0].result == CompileResult.SUCCEEDED
+    assert fallible_entries[0].output == rule_runner.request(ClasspathEntry, [request])
+
+
+@maybe_skip_jdk_test
+def test_compile_closure_matches_provider_requests(
+    rule_runner: RuleRunner, scala_stdlib_jvm_lockfile: JVMLockfileFixture
+) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "scala_sources(name='main')",
+            "3rdparty/jvm/BUILD": scala_stdlib_jvm_lockfile.requirements_as_jvm_artifact_targets(),
+            "3rdparty/jvm/default.lock": scala_stdlib_jvm_lockfile.serialized_lockfile,
+            "Example.scala": scala_main_source(),
+            # The Java and Scala sources form a cycle, and so the Java request has a prerequisite.
+            "lib/BUILD": "java_sources(dependencies=['other'])",
+            "lib/C.java": java_lib_source(["org.pantsbuild.example.Main"]),
+            "other/BUILD": "java_sources(dependencies=['files'])",
+            "other/D.java": "package org.pantsbuild.example.other;\n\npublic class D {}\n",
+            "other2/BUILD": "java_sources()",
+            "other2/E.java": "package org.pantsbuild.example.other2;\n\npublic class E {}\n",
+            "files/BUILD": "files(sources=['f.txt'], dependencies=['other2'])",
+            "files/f.txt": "",
+            "resources/BUILD": "resources(sources=['r.txt'], dependencies=['other'])",
+            "resources/r.txt": "",
+        }
+    )
+    factory = ClasspathEntryRequestFactory(
+        (
+            CompileJavaSourceRequest,
+            CompileScalaSourceRequest,
+            CoursierFetchRequest,
+            JvmResourcesRequest,
+            NoopClasspathEntryRequest,
+        ),
+        FrozenDict(),
+    )
+    resolve = make_resolve(rule_runner)
+
+    def coarsened(address: Address) -> CoarsenedTarget:
+        coarsened_targets = rule_runner.request(CoarsenedTargets, [Addresses([address])])
+        assert len(coarsened_targets) == 1
+        return coarsened_targets[0]
+
+    def closure(root: CoarsenedTarget) -> set[ClasspathEntryRequest]:
+        return set(_classpath_entry_closure(factory, [factory.for_targets(root, resolve)]))
+
+    other = CompileJavaSourceRequest(coarsened(Address("other")), resolve)
+    other_d = CompileJavaSourceRequest(
+        coarsened(Address("other", relative_file_path="D.java")), resolve
+    )
+
+    # Resources ignore the targets that they generate, and Java ignores `files` dependencies.
+    resources = coarsened(Address("resources"))
+    assert closure(resources) == {JvmResourcesRequest(resources, resolve), other, other_d}
+
+    # `files` do not request their dependencies at all.
+    files = coarsened(Address("files"))
+    assert closure(files) == {NoopClasspathEntryRequest(files, resolve)}
+
+    # Java requests its Scala prerequisite, and both request their dependencies.
+    cycle = expect_single_expanded_coarsened_target(
+        rule_runner, Address("", target_name="main", relative_file_path="Example.scala")
+    )
+    cycle_request = factory.for_targets(cycle, resolve)
+    assert isinstance(cycle_request, CompileJavaSourceRequest)
+    assert cycle_request.prerequisite == CompileScalaSourceRequest(cycle, resolve)
+    assert {cycle_request, cycle_request.prerequisite, other, other_d}.issubset(closure(cycle))
+
+
 @maybe_skip_jdk_test
 def test_compile_mixed_cycle(
     rule_runner: RuleRunner, scala_stdlib_jvm_lockfile: JVMLockfileFixture
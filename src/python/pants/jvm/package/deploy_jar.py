@@ -66,6 +66,7 @@ class DeployJarClasspathEntryRequest(ClasspathEntryRequest):
     field_sets = (DeployJarFieldSet,)
     # A `deploy_jar` can have a Classpath requested for it, but should not be used as a dependency.
     root_only = True
+    requests_dependencies = True
 
 
 @rule
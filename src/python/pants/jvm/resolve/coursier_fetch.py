@@ -66,6 +66,7 @@ from pants.jvm.target_types import (
 from pants.jvm.util_rules import ExtractFileDigest
 from pants.util.docutil import bin_name, doc_url
 from pants.util.logging import LogLevel
+from pants.util.memo import memoized_property
 from pants.util.strutil import bullet_list, pluralize
 
 if TYPE_CHECKING:
@@ -210,11 +211,16 @@ class CoursierResolvedLockfile:
             f"need to update your lockfile by running `coursier-resolve --names={key.name}`."
         )
 
+    @memoized_property
+    def _entries_by_group_and_artifact(self) -> dict[tuple[str, str], CoursierLockfileEntry]:
+        """An index of the entries, computed once per lockfile rather than once per lookup."""
+        return {(i.coord.group, i.coord.artifact): i for i in self.entries}
+
     def direct_dependencies(
         self, key: CoursierResolveKey, coord: Coordinate
     ) -> tuple[CoursierLockfileEntry, tuple[CoursierLockfileEntry, ...]]:
         """Return the entry for the given Coordinate, and for its direct dependencies."""
-        entries = {(i.coord.group, i.coord.artifact): i for i in self.entries}
+        entries = self._entries_by_group_and_artifact
         entry = entries.get((coord.group, coord.artifact))
         if entry is None:
             raise self._coordinate_not_found(key, coord)
@@ -225,7 +231,7 @@ class CoursierResolvedLockfile:
         self, key: CoursierResolveKey, coord: Coordinate
     ) -> tuple[CoursierLockfileEntry, tuple[CoursierLockfileEntry, ...]]:
         """Return the entry for the given Coordinate, and for its transitive dependencies."""
-        entries = {(i.coord.group, i.coord.artifact): i for i in self.entries}
+        entries = self._entries_by_group_and_artifact
         entry = entries.get((coord.group, coord.artifact))
         if entry is None:
             raise self._coordinate_not_found(key, coord)
@@ -793,11 +799,12 @@ async def materialize_classpath_for_tool(request: ToolClasspathRequest) -> ToolC
             )
 
     classpath_entries = await Get(ResolvedClasspathEntries, CoursierResolvedLockfile, resolution)
-    merged_snapshot = await Get(
-        Snapshot, MergeDigests(classpath_entry.digest for classpath_entry in classpath_entries)
-    )
-    if request.prefix is not None:
-        merged_snapshot = await Get(Snapshot, AddPrefix(merged_snapshot.digest, request.prefix))
+    merge_digests = MergeDigests(classpath_entry.digest for classpath_entry in classpath_entries)
+    if request.prefix is None:
+        merged_snapshot = await Get(Snapshot, MergeDigests, merge_digests)
+    else:
+        merged_digest = await Get(Digest, MergeDigests, merge_digests)
+        merged_snapshot = await Get(Snapshot, AddPrefix(merged_digest, request.prefix))
     return ToolClasspath(merged_snapshot)
 
 
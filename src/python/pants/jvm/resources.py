@@ -39,6 +39,9 @@ class JvmResourcesRequest(ClasspathEntryRequest):
         ResourcesFieldSet,
         ResourcesGeneratorFieldSet,
     )
+    requests_prerequisite = True
+    requests_dependencies = True
+    ignore_generated_dependencies = True
 
 
 @rule(desc="Assemble resources")
@@ -57,7 +60,12 @@ async def assemble_resources_jar(
     optional_prereq_request = [*((request.prerequisite,) if request.prerequisite else ())]
     fallibles = await MultiGet(
         Get(FallibleClasspathEntries, ClasspathEntryRequests(optional_prereq_request)),
-        Get(FallibleClasspathEntries, ClasspathDependenciesRequest(request, ignore_generated=True)),
+        Get(
+            FallibleClasspathEntries,
+            ClasspathDependenciesRequest(
+                request, ignore_generated=request.ignore_generated_dependencies
+            ),
+        ),
     )
     direct_dependency_classpath_entries = FallibleClasspathEntries(
         itertools.chain(*fallibles)